@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-15 22:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("indieweb", "0004_alter_auth_id_alter_token_id"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="auth",
+            name="key",
+            field=models.CharField(db_index=True, max_length=32),
+        ),
+    ]
@@ -18,7 +18,7 @@ class Auth(GenKeyMixin, TimeStampedModel):
     redirect_uri = models.CharField(max_length=1024)
     scope = models.CharField(max_length=256, null=True, blank=True)
     me = models.CharField(max_length=512)
-    key = models.CharField(max_length=32)
+    key = models.CharField(max_length=32, db_index=True)
 
     class Meta:
         unique_together = ("me", "client_id", "scope", "owner")
@@ -25,7 +25,7 @@ class CSRFExemptMixin:
 class TokenAuthMixin:
     def authenticated(self, request):
         key = None
-        auth_token = request.META.get("Authorization", request.POST.get("Authorization"))
+        auth_token = request.META.get("HTTP_AUTHORIZATION", request.POST.get("Authorization"))
         if auth_token is not None:
             key = auth_token.split()[-1]
         if key is not None:
@@ -64,22 +64,19 @@ class AuthView(CSRFExemptMixin, AccessMixin, View):
         redirect_uri = request.GET.get("redirect_uri")
         state = request.GET.get("state")
         me = request.GET.get("me")
-        logger.info(f"auth view get: {client_id}, {redirect_uri}, {state}, {me}")
+        logger.info("auth view get: %s, %s, %s, %s", client_id, redirect_uri, state, me)
         required = [client_id, redirect_uri, state, me]
 
         for name, val in zip(self.required_params, required):
             if val is None:
                 err_msg = f"missing parameter {name}"
-                logger.info(f"missing parameter: {name}")
+                logger.info("missing parameter: %s", name)
                 return HttpResponse(err_msg, status=404)
 
         # FIXME scope is optional
         scope = request.GET.get("scope")
-        try:
-            auth = Auth.objects.get(owner=request.user, client_id=client_id, scope=scope, me=me)
-            auth.delete()
-        except Auth.DoesNotExist:
-            pass
+        # drop a previous auth code so the timeout starts over
+        Auth.objects.filter(owner=request.user, client_id=client_id, scope=scope, me=me).delete()
         auth = Auth.objects.create(
             owner=request.user,
             client_id=client_id,
@@ -90,14 +87,14 @@ class AuthView(CSRFExemptMixin, AccessMixin, View):
         )
         url_params = {"code": auth.key, "state": state, "me": me}
         target = f"{redirect_uri}?{urlencode(url_params)}"
-        logger.info(f"auth view get complete: {target}")
+        logger.info("auth view get complete: %s", target)
         return redirect(target)
 
     def post(self, request, *args, **kwargs):
-        logger.info(f"auth view post: {request}, {args}, {kwargs}")
+        logger.info("auth view post: %s, %s, %s", request, args, kwargs)
         auth_code = request.POST["code"]
         client_id = request.POST["client_id"]
-        logger.info(f"auth view post: {client_id}, {auth_code}")
+        logger.info("auth view post: %s, %s", client_id, auth_code)
         auth = Auth.objects.get(key=auth_code, client_id=client_id)
         # if auth.key == key:
         response_values = {"me": auth.me}
@@ -126,9 +123,9 @@ class TokenView(CSRFExemptMixin, View):
         client_id = request.POST["client_id"]
         try:
             auth = Auth.objects.get(me=me, client_id=client_id, scope=scope)
-            logger.info(f"token view post: {client_id}, {me}, {key} {scope}")
+            logger.info("token view post: %s, %s, %s %s", client_id, me, key, scope)
         except Auth.DoesNotExist:
-            logger.info(f"auth does not exist: {client_id}, {me}, {scope}")
+            logger.info("auth does not exist: %s, %s, %s", client_id, me, scope)
             return HttpResponse("authentication error", status=401)
         if auth.key == key:
             # auth code is correct
@@ -13,19 +13,20 @@ import pytz
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.test import TestCase
-from django.urls import reverse
+from django.urls import reverse_lazy
 from django.utils.http import urlencode
 
 from indieweb.models import Auth
 
+AUTH_URL = reverse_lazy("indieweb:auth")
+
 
 class TestIndiewebAuthEndpoint(TestCase):
-    def setUp(self):
-        self.username = "foo"
-        self.email = "foo@example.org"
-        self.password = "password"
-        self.user = User.objects.create_user(self.username, self.email, self.password)
-        self.base_url = reverse("indieweb:auth")
+    @classmethod
+    def setUpTestData(cls):
+        cls.username = "foo"
+        cls.email = "foo@example.org"
+        cls.user = User.objects.create_user(cls.username, cls.email)
         url_params = {
             "me": "http://example.org",
             "client_id": "https://webapp.example.org",
@@ -33,7 +34,7 @@ class TestIndiewebAuthEndpoint(TestCase):
             "state": 1234567890,
             "scope": "post",
         }
-        self.endpoint_url = f"{self.base_url}?{urlencode(url_params)}"
+        cls.endpoint_url = f"{AUTH_URL}?{urlencode(url_params)}"
 
     def test_not_authenticated(self):
         """
@@ -46,21 +47,21 @@ class TestIndiewebAuthEndpoint(TestCase):
 
     def test_authenticated_without_params(self):
         """Assure get without proper parameters raises an error."""
-        self.client.login(username=self.username, password=self.password)
-        response = self.client.get(self.base_url)
+        self.client.force_login(self.user)
+        response = self.client.get(AUTH_URL)
         self.assertEqual(response.status_code, 404)
-        self.assertTrue("missing" in response.content.decode("utf-8"))
+        self.assertTrue(b"missing" in response.content)
 
     def test_authenticated(self):
         """Assure we get back an auth code if we are authenticated."""
-        self.client.login(username=self.username, password=self.password)
+        self.client.force_login(self.user)
         response = self.client.get(self.endpoint_url)
         self.assertEqual(response.status_code, 302)
         self.assertTrue("code" in response.url)
 
     def test_get_or_create(self):
         """Test get or create logic for Auth object."""
-        self.client.login(username=self.username, password=self.password)
+        self.client.force_login(self.user)
         for i in range(2):
             response = self.client.get(self.endpoint_url)
             self.assertEqual(response.status_code, 302)
@@ -68,7 +69,7 @@ class TestIndiewebAuthEndpoint(TestCase):
 
     def test_auth_timeout_reset(self):
         """Test timeout is resetted on new authentication."""
-        self.client.login(username=self.username, password=self.password)
+        self.client.force_login(self.user)
         response = self.client.get(self.endpoint_url)
         data = parse_qs(urlparse(response.url).query)
         auth = Auth.objects.get(owner=self.user, me=data["me"][0])
@@ -6,96 +6,87 @@ test_django-indieweb
 
 Tests for `django-indieweb` micropub endpoint.
 """
-from urllib.parse import unquote
+from urllib.parse import unquote_to_bytes
 
 from django.contrib.auth.models import User
-from django.test import TestCase
-from django.urls import reverse
+from django.test import RequestFactory, TestCase
+from django.urls import reverse_lazy
 
 from indieweb import models
 from indieweb.views import MicropubView
 
+MICROPUB_URL = reverse_lazy("indieweb:micropub")
+
 
 class DummyRequest:
-    GET = {}
-    POST = {}
-    META = {}
+    def __init__(self):
+        self.GET = {}
+        self.POST = {}
+        self.META = {}
 
 
 class TestIndiewebMicropubEndpoint(TestCase):
-    def setUp(self):
-        self.username = "foo"
-        self.email = "foo@example.org"
-        self.password = "password"
-        self.auth_code = "authkey"
-        self.redirect_uri = "https://webapp.example.org/auth/callback"
-        self.state = 1234567890
-        self.me = "http://example.org"
-        self.client_id = "https://webapp.example.org"
-        self.scope = "post"
-        self.user = User.objects.create_user(self.username, self.email, self.password)
-        self.auth = models.Auth.objects.create(
-            owner=self.user,
-            key=self.auth_code,
-            state=self.state,
-            me=self.me,
-            scope=self.scope,
+    factory = RequestFactory()
+    view = staticmethod(MicropubView.as_view())
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.username = "foo"
+        cls.email = "foo@example.org"
+        cls.auth_code = "authkey"
+        cls.redirect_uri = "https://webapp.example.org/auth/callback"
+        cls.state = 1234567890
+        cls.me = "http://example.org"
+        cls.client_id = "https://webapp.example.org"
+        cls.scope = "post"
+        cls.user = User.objects.create_user(cls.username, cls.email)
+        cls.auth = models.Auth.objects.create(
+            owner=cls.user,
+            key=cls.auth_code,
+            state=cls.state,
+            me=cls.me,
+            scope=cls.scope,
         )
-        self.token = models.Token.objects.create(
-            me=self.me, client_id=self.client_id, scope=self.scope, owner=self.user
+        cls.token = models.Token.objects.create(me=cls.me, client_id=cls.client_id, scope=cls.scope, owner=cls.user)
+        cls.auth_header = f"Bearer {cls.token.key}"
+        cls.wrong_scope_token = models.Token.objects.create(
+            me="http://example.org/wrong-scope", client_id=cls.client_id, scope="foo", owner=cls.user
         )
-        self.endpoint_url = reverse("indieweb:micropub")
-        self.content = "foobar"
-
-    def test_no_token(self):
-        """Assert we can't post to the endpoint without token."""
-        payload = {"content": self.content, "h": "entry"}
-        response = self.client.post(self.endpoint_url, data=payload)
-        self.assertEqual(response.status_code, 401)
-        self.assertTrue("error" in response.content.decode("utf-8"))
-
-    def test_wrong_token(self):
-        """Assert we can't post to the endpoint without the right token."""
-        payload = {"content": self.content, "h": "entry"}
-        auth_header = "Bearer {}".format("wrongtoken")
-        response = self.client.post(self.endpoint_url, data=payload, Authorization=auth_header)
-        self.assertEqual(response.status_code, 401)
-        self.assertTrue("error" in response.content.decode("utf-8"))
-
-    def test_correct_token_header(self):
-        """
-        Assert we can post to the endpoint with the right token
-        submitted in the requests header.
-        """
-        payload = {"content": self.content, "h": "entry"}
-        auth_header = f"Bearer {self.token.key}"
-        response = self.client.post(self.endpoint_url, data=payload, Authorization=auth_header)
-        self.assertEqual(response.status_code, 201)
-        self.assertTrue("created" in response.content.decode("utf-8"))
-
-    def test_correct_token_body(self):
+        cls.wrong_scope_header = f"Bearer {cls.wrong_scope_token.key}"
+        cls.content = "foobar"
+        cls.payload = {"content": cls.content, "h": "entry"}
+        cls.body_auth_payload = {**cls.payload, "Authorization": cls.auth_header}
+
+    def test_rejected_tokens(self):
+        """Assert we can't post without a valid token carrying the right scope."""
+        cases = [
+            ("no token", self.payload, {}, 401),
+            ("wrong token", self.payload, {"HTTP_AUTHORIZATION": "Bearer wrongtoken"}, 401),
+            ("wrong scope header", self.payload, {"HTTP_AUTHORIZATION": self.wrong_scope_header}, 403),
+            ("wrong scope body", {**self.payload, "Authorization": self.wrong_scope_header}, {}, 403),
+        ]
+        for name, payload, headers, status in cases:
+            with self.subTest(name):
+                response = self.client.post(MICROPUB_URL, data=payload, **headers)
+                self.assertEqual(response.status_code, status)
+                self.assertTrue(b"error" in response.content)
+
+    def test_correct_token(self):
         """
         Assert we can post to the endpoint with the right token
-        submitted in the requests body.
+        submitted either in the requests header or in its body.
         """
-        auth_body = f"Bearer {self.token.key}"
-        payload = {"content": self.content, "h": "entry", "Authorization": auth_body}
-        response = self.client.post(self.endpoint_url, data=payload)
-        self.assertEqual(response.status_code, 201)
-        self.assertTrue("created" in response.content.decode("utf-8"))
-
-    def test_not_authorized(self):
-        """Assure we cant post if we don't have the right scope."""
-        auth_body = f"Bearer {self.token.key}"
-        old_scope = self.token.scope
-        self.token.scope = "foo"
-        self.token.save()
-        payload = {"content": self.content, "h": "entry", "Authorization": auth_body}
-        response = self.client.post(self.endpoint_url, data=payload)
-        self.assertEqual(response.status_code, 403)
-        self.assertTrue("error" in response.content.decode("utf-8"))
-        self.token.scope = old_scope
-        self.token.save()
+        cases = [
+            ("header", self.payload, {"HTTP_AUTHORIZATION": self.auth_header}),
+            ("body", self.body_auth_payload, {}),
+        ]
+        for name, payload, headers in cases:
+            with self.subTest(name):
+                request = self.factory.post(MICROPUB_URL, data=payload, **headers)
+                with self.assertNumQueries(1):
+                    response = self.view(request)
+                self.assertEqual(response.status_code, 201)
+                self.assertTrue(b"created" in response.content)
 
     def test_content(self):
         """Test post with content."""
@@ -145,16 +136,18 @@ class TestIndiewebMicropubEndpoint(TestCase):
         """
         Test authentication tokens via get request to micropub endpoint.
         """
-        auth_header = f"Bearer {self.token.key}"
-        response = self.client.get(self.endpoint_url, Authorization=auth_header)
-        response_text = unquote(response.content.decode("utf-8"))
+        request = self.factory.get(MICROPUB_URL, HTTP_AUTHORIZATION=self.auth_header)
+        # token and owner are fetched together
+        with self.assertNumQueries(1):
+            response = self.view(request)
         self.assertEqual(response.status_code, 200)
-        self.assertTrue(self.me in response_text)
+        self.assertTrue(self.me.encode() in unquote_to_bytes(response.content))
 
     def test_token_verification_on_get_wrong(self):
         """
         Test wrong authentication tokens via get request to micropub endpoint.
         """
         auth_header = "Bearer {}".format("wrong_token")
-        response = self.client.get(self.endpoint_url, Authorization=auth_header)
+        request = self.factory.get(MICROPUB_URL, HTTP_AUTHORIZATION=auth_header)
+        response = self.view(request)
         self.assertEqual(response.status_code, 401)
@@ -8,12 +8,12 @@ test_django-indieweb
 Tests for `django-indieweb` models module.
 """
 
-from django.test import TestCase
+from django.test import SimpleTestCase
 
 # from indieweb import models
 
 
-class TestIndieweb(TestCase):
+class TestIndieweb(SimpleTestCase):
     def setUp(self):
         pass
 